@@ -1,29 +1,439 @@
 # -*- coding: utf-8 -*-
 """
 Build SWMM-ready layers from non-standard GIS layers using Processing.
+
+The mapping done here is memory-bound: per feature it only copies
+attributes and forwards geometry, with no heavy per-row arithmetic.
+Optimizations should therefore target bytes moved and Python-to-C++
+transitions, not CPU tricks. The writer strategy is chosen per source:
+file-backed OGR inputs take the columnar pyogrio bulk path with chunked
+FastInsert writes, everything else runs through the
+QgsProcessingFeatureBasedAlgorithm pipeline where iteration and sink
+writes stay on the C++ side (the sink is opened with FastInsert there
+as well).
 """
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+import pandas as pd
 from qgis.PyQt.QtCore import QVariant, QCoreApplication
 from qgis.core import (
     QgsFeature,
+    QgsFeatureRequest,
+    QgsFeatureSink,
     QgsFields,
     QgsField,
+    QgsGeometry,
     QgsProcessing,
-    QgsProcessingAlgorithm,
     QgsProcessingException,
+    QgsProcessingFeatureBasedAlgorithm,
+    QgsProcessingFeatureSourceDefinition,
     QgsProcessingParameterField,
-    QgsProcessingParameterVectorDestination,
-    QgsProcessingParameterVectorLayer,
 )
 from .g_s_defaults import def_qgis_fields_dict
 
+# optional: columnar reads for OGR sources (see processAlgorithm fast path)
+try:
+    from pyogrio.raw import read as _pyogrio_read
+except ImportError:
+    _pyogrio_read = None
+
 
 def _tr(message: str) -> str:
     """Translate helper."""
     return QCoreApplication.translate('SwmmLayerBuilder', message)
 
 
-class SwmmLayerBuilderAlgorithm(QgsProcessingAlgorithm):
+# values treated as "missing" when mapping source attributes
+_EMPTY = (None, '')
+
+_QVARIANT_TYPE_MAP = {
+    'Double': QVariant.Double,
+    'String': QVariant.String,
+    'Int': QVariant.Int,
+    'Bool': QVariant.Bool,
+    'Date': QVariant.Date,
+    'Time': QVariant.Time
+}
+
+
+def _build_qgsfields(fields_def: Dict[str, str]) -> QgsFields:
+    """Build a QgsFields object from a section's field-type definition."""
+    fields = QgsFields()
+    for name, typ in fields_def.items():
+        fields.append(QgsField(name, _QVARIANT_TYPE_MAP[typ]))
+    return fields
+
+
+# one QgsFields template per SWMM section, built once at import
+_TARGET_FIELDS_BY_SECTION: Dict[str, QgsFields] = {
+    section: _build_qgsfields(fields_def)
+    for section, fields_def in def_qgis_fields_dict.items()
+}
+
+
+def _make_assembler(plan: Tuple[Tuple[int, object], ...]):
+    """
+    Build a specialized attribute-assembly function for a resolved plan.
+    The plan and the empty-value tuple are bound into the closure so the
+    per-feature call works on locals only, with a single bound
+    feature.attribute method resolved per row. The returned list is a
+    buffer reused across calls; QgsFeature.setAttributes copies it, so
+    callers must not keep a reference past the next call.
+    """
+    row_buf = [None] * len(plan)
+
+    def assemble(feature, _plan=plan, _empty=_EMPTY, _buf=row_buf):
+        get = feature.attribute
+        for i, (idx, default_val) in enumerate(_plan):
+            _buf[i] = val if idx >= 0 and (val := get(idx)) not in _empty else default_val
+        return _buf
+
+    return assemble
+
+
+@lru_cache(maxsize=32)
+def _resolve_plan(
+    section: str,
+    source_field_names: Tuple[str, ...],
+    field_map_items: Tuple[Tuple[str, str], ...]
+) -> Tuple[Tuple[int, object], ...]:
+    """
+    Resolve the per-target (input index, default) plan for a section.
+    Cached so repeated batch runs on layers with the same schema and
+    field choices skip the resolution work entirely.
+    """
+    defaults = _defaults_for_section(section)
+    name_idx = {name: i for i, name in enumerate(source_field_names)}
+    lower_idx = {}
+    for i, name in enumerate(source_field_names):
+        lower_idx.setdefault(name.lower(), i)
+
+    def _lookup(name):
+        # same semantics as QgsFields.lookupField: exact match first,
+        # then the first case-insensitive match
+        if not name:
+            return -1
+        if name in name_idx:
+            return name_idx[name]
+        return lower_idx.get(name.lower(), -1)
+
+    return tuple(
+        (_lookup(mapped), defaults.get(target))
+        for target, mapped in field_map_items
+    )
+
+
+def _ogr_source_parts(layer):
+    """
+    Split an OGR layer source into (path, layername).
+    Returns (None, None) if the source carries extra options
+    which the bulk reader cannot reproduce.
+    """
+    parts = layer.source().split('|')
+    path = parts[0]
+    layer_name = None
+    for part in parts[1:]:
+        if part.startswith('layername='):
+            layer_name = part.split('=', 1)[1]
+        elif part:
+            return None, None
+    return path, layer_name
+
+
+# fallback values per section when a field is missing or empty in the
+# source; read-only so the shared dicts cannot be mutated by callers
+_SECTION_DEFAULTS: Mapping[str, Mapping[str, object]] = MappingProxyType({
+    'SUBCATCHMENTS': MappingProxyType({
+        'Name': '',
+        'RainGage': '*',
+        'Outlet': '',
+        'Area': 0,
+        'Imperv': 0,
+        'Width': 0,
+        'Slope': 0.5,
+        'CurbLen': 0,
+        'SnowPack': '',
+        'N_Imperv': 0.01,
+        'N_Perv': 0.1,
+        'S_Imperv': 1.8,
+        'S_Perv': 3,
+        'PctZero': 0,
+        'RouteTo': 'OUTLET',
+        'PctRouted': 100,
+        'InfMethod': '',
+        'SuctHead': None,
+        'Conductiv': None,
+        'InitDef': None,
+        'MaxRate': None,
+        'MinRate': None,
+        'Decay': None,
+        'DryTime': None,
+        'MaxInf': None,
+        'CurveNum': None
+    }),
+    'JUNCTIONS': MappingProxyType({
+        'Name': '',
+        'Elevation': 0,
+        'MaxDepth': 0,
+        'InitDepth': 0,
+        'SurDepth': 0,
+        'Aponded': 0
+    }),
+    'OUTFALLS': MappingProxyType({
+        'Name': '',
+        'Elevation': 0,
+        'Type': 'FREE',
+        'FixedStage': None,
+        'Curve_TS': '',
+        'FlapGate': '',
+        'RouteTo': ''
+    }),
+    'RAINGAGES': MappingProxyType({
+        'Name': '',
+        'Format': '',
+        'Interval': '',
+        'SCF': 1.0,
+        'DataSource': '',
+        'SeriesName': '',
+        'FileName': '',
+        'StationID': '',
+        'RainUnits': ''
+    }),
+    'STORAGE': MappingProxyType(
+        {k: 0 if v == 'Double' else '' for k, v in def_qgis_fields_dict['STORAGE'].items()}
+    ),
+    'CONDUITS': MappingProxyType({
+        'Name': '',
+        'FromNode': '',
+        'ToNode': '',
+        'Length': 0,
+        'Roughness': 0.01,
+        'InOffset': 0,
+        'OutOffset': 0,
+        'InitFlow': 0,
+        'MaxFlow': 0,
+        'XsectShape': '',
+        'Geom1': 0,
+        'Geom2': 0,
+        'Geom3': 0,
+        'Geom4': 0,
+        'Barrels': 1,
+        'Culvert': '',
+        'Shp_Trnsct': '',
+        'Kentry': 0,
+        'Kexit': 0,
+        'Kavg': 0,
+        'FlapGate': '',
+        'Seepage': 0
+    }),
+    'ORIFICES': MappingProxyType({
+        'Name': '',
+        'FromNode': '',
+        'ToNode': '',
+        'Type': '',
+        'InOffset': 0,
+        'Qcoeff': 0,
+        'FlapGate': '',
+        'CloseTime': 0,
+        'XsectShape': '',
+        'Height': 0,
+        'Width': 0
+    }),
+    'PUMPS': MappingProxyType({
+        'Name': '',
+        'FromNode': '',
+        'ToNode': '',
+        'PumpCurve': '',
+        'Status': '',
+        'Startup': 0,
+        'Shutoff': 0
+    }),
+    'WEIRS': MappingProxyType({
+        'Name': '',
+        'FromNode': '',
+        'ToNode': '',
+        'Type': '',
+        'CrestHeigh': 0,
+        'Qcoeff': 0,
+        'FlapGate': '',
+        'EndContrac': 0,
+        'EndCoeff': 0,
+        'Surcharge': '',
+        'RoadWidth': 0,
+        'RoadSurf': '',
+        'CoeffCurve': '',
+        'Height': 0,
+        'Length': 0,
+        'SideSlope': 0
+    }),
+})
+
+
+def _defaults_for_section(section: str) -> Mapping[str, object]:
+    """Fallback values when a field is missing or empty in the source."""
+    defaults = _SECTION_DEFAULTS.get(section)
+    if defaults is not None:
+        return defaults
+    return {k: None for k in def_qgis_fields_dict[section].keys()}
+
+
+@lru_cache(maxsize=None)
+def _field_definitions(section: str) -> List[Tuple[str, str, str, bool]]:
+    """Define which SWMM fields can be mapped per section (param id, label, target, required)."""
+    if section == 'SUBCATCHMENTS':
+        return [
+            ('NAME_FIELD', 'Name field', 'Name', True),
+            ('RAINGAGE_FIELD', 'RainGage field', 'RainGage', False),
+            ('OUTLET_FIELD', 'Outlet field', 'Outlet', True),
+            ('AREA_FIELD', 'Area field', 'Area', False),
+            ('IMPERV_FIELD', '%Imperv field', 'Imperv', True),
+            ('WIDTH_FIELD', 'Width field', 'Width', False),
+            ('SLOPE_FIELD', 'Slope field', 'Slope', False),
+            ('CURBLEN_FIELD', 'CurbLen field', 'CurbLen', False),
+            ('SNOWPACK_FIELD', 'SnowPack field', 'SnowPack', False),
+            ('NIMPERV_FIELD', 'N-Imperv field', 'N_Imperv', False),
+            ('NPERV_FIELD', 'N-Perv field', 'N_Perv', False),
+            ('SIMPERV_FIELD', 'S-Imperv field', 'S_Imperv', False),
+            ('SPERV_FIELD', 'S-Perv field', 'S_Perv', False),
+            ('PCTZERO_FIELD', 'PctZero field', 'PctZero', False),
+            ('ROUTETO_FIELD', 'RouteTo field', 'RouteTo', False),
+            ('PCTR_FIELD', 'PctRouted field', 'PctRouted', False),
+            ('INFMETHOD_FIELD', 'InfMethod field', 'InfMethod', False),
+            ('SUCTHEAD_FIELD', 'SuctHead field', 'SuctHead', False),
+            ('CONDUCTIV_FIELD', 'Conductiv field', 'Conductiv', False),
+            ('INITDEF_FIELD', 'InitDef field', 'InitDef', False),
+            ('MAXRATE_FIELD', 'MaxRate field', 'MaxRate', False),
+            ('MINRATE_FIELD', 'MinRate field', 'MinRate', False),
+            ('DECAY_FIELD', 'Decay field', 'Decay', False),
+            ('DRYTIME_FIELD', 'DryTime field', 'DryTime', False),
+            ('MAXINF_FIELD', 'MaxInf field', 'MaxInf', False),
+            ('CURVENUM_FIELD', 'CurveNum field', 'CurveNum', False),
+        ]
+    if section == 'JUNCTIONS':
+        return [
+            ('NAME_FIELD', 'Name field', 'Name', True),
+            ('ELEV_FIELD', 'Elevation field', 'Elevation', True),
+            ('MAXDEPTH_FIELD', 'MaxDepth field', 'MaxDepth', True),
+            ('INITDEPTH_FIELD', 'InitDepth field', 'InitDepth', False),
+            ('SURDEPTH_FIELD', 'SurDepth field', 'SurDepth', False),
+            ('APONDED_FIELD', 'Aponded field', 'Aponded', False),
+        ]
+    if section == 'OUTFALLS':
+        return [
+            ('NAME_FIELD', 'Name field', 'Name', True),
+            ('ELEV_FIELD', 'Elevation field', 'Elevation', True),
+            ('TYPE_FIELD', 'Type field', 'Type', True),
+            ('FIXED_FIELD', 'FixedStage field', 'FixedStage', False),
+            ('CURVE_FIELD', 'Curve_TS field', 'Curve_TS', False),
+            ('FLAP_FIELD', 'FlapGate field', 'FlapGate', False),
+            ('ROUTETO_FIELD', 'RouteTo field', 'RouteTo', False),
+        ]
+    if section == 'RAINGAGES':
+        return [
+            ('NAME_FIELD', 'Name field', 'Name', True),
+            ('FORMAT_FIELD', 'Format field', 'Format', True),
+            ('INTERVAL_FIELD', 'Interval field', 'Interval', True),
+            ('SCF_FIELD', 'SCF field', 'SCF', False),
+            ('DATASRC_FIELD', 'DataSource field', 'DataSource', False),
+            ('SERIES_FIELD', 'SeriesName field', 'SeriesName', False),
+            ('FILE_FIELD', 'FileName field', 'FileName', False),
+            ('STATION_FIELD', 'StationID field', 'StationID', False),
+            ('RAINUNITS_FIELD', 'RainUnits field', 'RainUnits', False),
+        ]
+    if section == 'STORAGE':
+        return [
+            ('NAME_FIELD', 'Name field', 'Name', True),
+            ('ELEV_FIELD', 'Elevation field', 'Elevation', True),
+            ('MAXDEPTH_FIELD', 'MaxDepth field', 'MaxDepth', True),
+            ('INITDEPTH_FIELD', 'InitDepth field', 'InitDepth', False),
+            ('TYPE_FIELD', 'Type field', 'Type', False),
+            ('CURVE_FIELD', 'Curve field', 'Curve', False),
+            ('COEFF_FIELD', 'Coeff field', 'Coeff', False),
+            ('EXP_FIELD', 'Exponent field', 'Exponent', False),
+            ('CONST_FIELD', 'Constant field', 'Constant', False),
+            ('MAJORAX_FIELD', 'MajorAxis field', 'MajorAxis', False),
+            ('MINORAX_FIELD', 'MinorAxis field', 'MinorAxis', False),
+            ('SIDESLOPE_FIELD', 'SideSlope field', 'SideSlope', False),
+            ('SURFHEIGHT_FIELD', 'SurfHeight field', 'SurfHeight', False),
+            ('SURDEPTH_FIELD', 'SurDepth field', 'SurDepth', False),
+            ('FEVAP_FIELD', 'Fevap field', 'Fevap', False),
+            ('PSI_FIELD', 'Psi field', 'Psi', False),
+            ('KSAT_FIELD', 'Ksat field', 'Ksat', False),
+            ('IMD_FIELD', 'IMD field', 'IMD', False),
+        ]
+    if section == 'CONDUITS':
+        return [
+            ('NAME_FIELD', 'Name field', 'Name', True),
+            ('FROM_FIELD', 'FromNode field', 'FromNode', True),
+            ('TO_FIELD', 'ToNode field', 'ToNode', True),
+            ('LENGTH_FIELD', 'Length field', 'Length', True),
+            ('ROUGH_FIELD', 'Roughness field', 'Roughness', False),
+            ('INOFF_FIELD', 'InOffset field', 'InOffset', False),
+            ('OUTOFF_FIELD', 'OutOffset field', 'OutOffset', False),
+            ('INITFLOW_FIELD', 'InitFlow field', 'InitFlow', False),
+            ('MAXFLOW_FIELD', 'MaxFlow field', 'MaxFlow', False),
+            ('XSECTSHAPE_FIELD', 'XsectShape field', 'XsectShape', False),
+            ('GEOM1_FIELD', 'Geom1 field', 'Geom1', False),
+            ('GEOM2_FIELD', 'Geom2 field', 'Geom2', False),
+            ('GEOM3_FIELD', 'Geom3 field', 'Geom3', False),
+            ('GEOM4_FIELD', 'Geom4 field', 'Geom4', False),
+            ('BARRELS_FIELD', 'Barrels field', 'Barrels', False),
+            ('CULVERT_FIELD', 'Culvert field', 'Culvert', False),
+            ('SHPTRNS_FIELD', 'Shp_Trnsct field', 'Shp_Trnsct', False),
+            ('KENTRY_FIELD', 'Kentry field', 'Kentry', False),
+            ('KEXIT_FIELD', 'Kexit field', 'Kexit', False),
+            ('KAVG_FIELD', 'Kavg field', 'Kavg', False),
+            ('FLAP_FIELD', 'FlapGate field', 'FlapGate', False),
+            ('SEEP_FIELD', 'Seepage field', 'Seepage', False),
+        ]
+    if section == 'ORIFICES':
+        return [
+            ('NAME_FIELD', 'Name field', 'Name', True),
+            ('FROM_FIELD', 'FromNode field', 'FromNode', True),
+            ('TO_FIELD', 'ToNode field', 'ToNode', True),
+            ('TYPE_FIELD', 'Type field', 'Type', True),
+            ('INOFF_FIELD', 'InOffset field', 'InOffset', False),
+            ('QCOEFF_FIELD', 'Qcoeff field', 'Qcoeff', False),
+            ('FLAP_FIELD', 'FlapGate field', 'FlapGate', False),
+            ('CLOSETIME_FIELD', 'CloseTime field', 'CloseTime', False),
+            ('XSECTSHAPE_FIELD', 'XsectShape field', 'XsectShape', False),
+            ('HEIGHT_FIELD', 'Height field', 'Height', False),
+            ('WIDTH_FIELD', 'Width field', 'Width', False),
+        ]
+    if section == 'PUMPS':
+        return [
+            ('NAME_FIELD', 'Name field', 'Name', True),
+            ('FROM_FIELD', 'FromNode field', 'FromNode', True),
+            ('TO_FIELD', 'ToNode field', 'ToNode', True),
+            ('CURVE_FIELD', 'PumpCurve field', 'PumpCurve', True),
+            ('STATUS_FIELD', 'Status field', 'Status', False),
+            ('STARTUP_FIELD', 'Startup field', 'Startup', False),
+            ('SHUTOFF_FIELD', 'Shutoff field', 'Shutoff', False),
+        ]
+    if section == 'WEIRS':
+        return [
+            ('NAME_FIELD', 'Name field', 'Name', True),
+            ('FROM_FIELD', 'FromNode field', 'FromNode', True),
+            ('TO_FIELD', 'ToNode field', 'ToNode', True),
+            ('TYPE_FIELD', 'Type field', 'Type', True),
+            ('CREST_FIELD', 'CrestHeigh field', 'CrestHeigh', False),
+            ('QCOEFF_FIELD', 'Qcoeff field', 'Qcoeff', False),
+            ('FLAP_FIELD', 'FlapGate field', 'FlapGate', False),
+            ('ENDCONTR_FIELD', 'EndContrac field', 'EndContrac', False),
+            ('ENDCOEFF_FIELD', 'EndCoeff field', 'EndCoeff', False),
+            ('SURCH_FIELD', 'Surcharge field', 'Surcharge', False),
+            ('ROADWIDTH_FIELD', 'RoadWidth field', 'RoadWidth', False),
+            ('ROADSURF_FIELD', 'RoadSurf field', 'RoadSurf', False),
+            ('COEFFCURVE_FIELD', 'CoeffCurve field', 'CoeffCurve', False),
+            ('HEIGHT_FIELD', 'Height field', 'Height', False),
+            ('LENGTH_FIELD', 'Length field', 'Length', False),
+            ('SIDESLOPE_FIELD', 'SideSlope field', 'SideSlope', False),
+        ]
+    return []
+
+
+class SwmmLayerBuilderAlgorithm(QgsProcessingFeatureBasedAlgorithm):
     """
     Generic builder that maps an input layer into the SWMM schema for a given section.
     """
@@ -35,29 +445,15 @@ class SwmmLayerBuilderAlgorithm(QgsProcessingAlgorithm):
         self.INPUT_LAYER = "INPUT_LAYER"
         self.OUTPUT = "OUTPUT"
         # tuples: (param_id, label, target_field, required_bool)
-        self.field_params: List[Tuple[str, str, str, bool]] = self._field_definitions(section_key)
+        self.field_params: List[Tuple[str, str, str, bool]] = _field_definitions(section_key)
+        self._needed_attrs: List[int] = []
+        self._plan: Tuple[Tuple[int, object], ...] = ()
+        self._area_pos = -1
+        self._width_pos = -1
+        self._target_fields = _TARGET_FIELDS_BY_SECTION[section_key]
 
-    def initAlgorithm(self, config=None):
-        """Declare input layer, output sink, and per-field mapping parameters."""
-        geom_param_type = {
-            'Point': [QgsProcessing.SourceType.TypeVectorPoint],
-            'LineString': [QgsProcessing.SourceType.TypeVectorLine],
-            'Polygon': [QgsProcessing.SourceType.TypeVectorPolygon],
-        }[self.geom_type]
-
-        self.addParameter(
-            QgsProcessingParameterVectorLayer(
-                self.INPUT_LAYER,
-                _tr(f"Input {self.geom_type} layer"),
-                geom_param_type
-            )
-        )
-        self.addParameter(
-            QgsProcessingParameterVectorDestination(
-                self.OUTPUT,
-                _tr("SWMM layer output")
-            )
-        )
+    def initParameters(self, config=None):
+        """Declare per-field mapping parameters (input/output come from the base class)."""
         for param_id, label, target_field, required in self.field_params:
             self.addParameter(
                 QgsProcessingParameterField(
@@ -69,6 +465,39 @@ class SwmmLayerBuilderAlgorithm(QgsProcessingAlgorithm):
                 )
             )
 
+    def inputParameterName(self):
+        return self.INPUT_LAYER
+
+    def inputParameterDescription(self):
+        return _tr(f"Input {self.geom_type} layer")
+
+    def inputLayerTypes(self):
+        return {
+            'Point': [QgsProcessing.SourceType.TypeVectorPoint],
+            'LineString': [QgsProcessing.SourceType.TypeVectorLine],
+            'Polygon': [QgsProcessing.SourceType.TypeVectorPolygon],
+        }[self.geom_type]
+
+    def outputName(self):
+        return _tr("SWMM layer output")
+
+    def outputFields(self, inputFields):
+        return self._target_fields
+
+    def outputWkbType(self, inputWkbType):
+        return inputWkbType
+
+    def outputCrs(self, inputCrs):
+        return inputCrs
+
+    def sinkFlags(self):
+        # all features are newly created, so the sink may skip fid lookups
+        return QgsFeatureSink.FastInsert
+
+    def request(self):
+        # fetch only the mapped source columns; geometry is still read
+        return QgsFeatureRequest().setSubsetOfAttributes(self._needed_attrs)
+
     def name(self):
         return f"Build{self.section_key.capitalize()}"
 
@@ -87,371 +516,193 @@ class SwmmLayerBuilderAlgorithm(QgsProcessingAlgorithm):
     def createInstance(self):
         return SwmmLayerBuilderAlgorithm(self.section_key, self._display_name, self.geom_type)
 
-    def processAlgorithm(self, parameters, context, feedback):
-        """Create an output layer with SWMM fields, mapping user-selected or auto-matched fields."""
-        input_layer = self.parameterAsVectorLayer(parameters, self.INPUT_LAYER, context)
-        if input_layer is None:
+    def prepareAlgorithm(self, parameters, context, feedback):
+        """Resolve the field mapping once so processFeature only assembles attributes."""
+        source = self.parameterAsSource(parameters, self.INPUT_LAYER, context)
+        if source is None:
             raise QgsProcessingException(_tr("Input layer is required."))
 
         field_map = {}
-        layer_field_names = input_layer.fields().names()
+        layer_field_names = set(source.fields().names())
         for param_id, _, target_field, _ in self.field_params:
-            param_val = self.parameterAsString(parameters, param_id, context)
+            field_choice = self.parameterAsFields(parameters, param_id, context)
+            param_val = field_choice[0] if field_choice else ''
             if not param_val and target_field in layer_field_names:
                 # auto-select if the layer already has a matching field name
                 param_val = target_field
             field_map[target_field] = param_val
 
-        target_fields_def = def_qgis_fields_dict[self.section_key]
-        type_map = {
-            'Double': QVariant.Double,
-            'String': QVariant.String,
-            'Int': QVariant.Int,
-            'Bool': QVariant.Bool,
-            'Date': QVariant.Date,
-            'Time': QVariant.Time
-        }
-        target_fields = QgsFields()
-        for name, typ in target_fields_def.items():
-            target_fields.append(QgsField(name, type_map[typ]))
+        # resolve each target field to an (input index, default) pair once;
+        # processFeature then only needs integer attribute access
+        target_order = list(def_qgis_fields_dict[self.section_key].keys())
+        self._field_map = field_map
+        self._target_order = target_order
+        self._plan = _resolve_plan(
+            self.section_key,
+            tuple(source.fields().names()),
+            tuple((target, field_map[target]) for target in target_order)
+        )
+        self._assemble = _make_assembler(self._plan)
+        self._needed_attrs = sorted({idx for idx, _ in self._plan if idx >= 0})
+        # positions of auto-computed subcatchment values (only when not mapped)
+        self._area_pos = -1
+        self._width_pos = -1
+        if self.section_key == 'SUBCATCHMENTS':
+            if not field_map['Area']:
+                self._area_pos = target_order.index('Area')
+            if not field_map['Width']:
+                self._width_pos = target_order.index('Width')
+        return True
+
+    def processAlgorithm(self, parameters, context, feedback):
+        """Run the columnar bulk copy when possible, otherwise the per-feature pipeline."""
+        input_layer = self.parameterAsVectorLayer(parameters, self.INPUT_LAYER, context)
+        if self._can_bulk_copy(parameters, input_layer):
+            frame, geometries = self._read_bulk_frame(input_layer, feedback)
+            if frame is not None:
+                return self._write_bulk_frame(frame, geometries, input_layer, parameters, context, feedback)
+        return super().processAlgorithm(parameters, context, feedback)
+
+    def _can_bulk_copy(self, parameters, input_layer):
+        """Check whether the input can be read columnar straight from its OGR source."""
+        if _pyogrio_read is None or input_layer is None:
+            return False
+        raw_param = parameters.get(self.INPUT_LAYER) if isinstance(parameters, dict) else None
+        if isinstance(raw_param, QgsProcessingFeatureSourceDefinition):
+            if raw_param.selectedFeaturesOnly or raw_param.featureLimit != -1:
+                return False
+            # filterExpression exists starting with QGIS 3.32
+            filter_expression = getattr(raw_param, 'filterExpression', None)
+            if filter_expression is not None and filter_expression():
+                return False
+        if input_layer.providerType() != 'ogr':
+            return False
+        if input_layer.subsetString() or input_layer.isEditable():
+            return False
+        if input_layer.fields().names() != input_layer.dataProvider().fields().names():
+            # joined or virtual fields only exist on the layer, not in the file
+            return False
+        path, _ = _ogr_source_parts(input_layer)
+        return path is not None
+
+    def _read_bulk_frame(self, input_layer, feedback):
+        """
+        Read the mapped source columns and geometries in one columnar pass.
+        Returns (None, None) when the source cannot be read this way,
+        in which case the per-feature pipeline is used instead.
+        """
+        path, layer_name = _ogr_source_parts(input_layer)
+        needed_cols = sorted({f for f in self._field_map.values() if f})
+        try:
+            meta, _, geoms, field_data = _pyogrio_read(
+                path,
+                layer=layer_name,
+                columns=needed_cols
+            )
+        except Exception:
+            feedback.pushWarning(
+                'Could not read '
+                + str(path)
+                + ' with pyogrio, falling back to feature iteration.'
+            )
+            return None, None
+        source_df = pd.DataFrame(
+            {name: data for name, data in zip(meta['fields'], field_data)}
+        )
+        if any(f not in source_df.columns for f in needed_cols):
+            # pyogrio silently drops column names it cannot match exactly
+            # (e.g. case differences); those fields would be filled with
+            # defaults instead of their real values, so use the
+            # per-feature pipeline for this layer
+            return None, None
+        n_rows = len(geoms)
+        defaults = _defaults_for_section(self.section_key)
+        target_types = def_qgis_fields_dict[self.section_key]
+        frame = {}
+        for target in self._target_order:
+            mapped = self._field_map[target]
+            default_val = defaults.get(target)
+            if mapped and mapped in source_df.columns:
+                col = source_df[mapped]
+                if target_types[target] in ('Double', 'Int'):
+                    # numeric targets: coerce and fill in one vectorized
+                    # pass; only originally missing values get the
+                    # default, coercion failures stay None as they would
+                    # become NULL on the per-feature path
+                    missing = col.isna() | (col == '')
+                    col = pd.to_numeric(col.mask(missing), errors='coerce')
+                    if default_val is not None:
+                        col = col.mask(missing, other=default_val)
+                else:
+                    col = col.mask(col.isna() | (col == ''), other=default_val)
+            else:
+                col = pd.Series([default_val] * n_rows, dtype=object)
+            frame[target] = col
+        out_df = pd.DataFrame(frame)
+        out_df = out_df.astype(object).where(out_df.notna(), None)
+        geometries = []
+        for wkb in geoms:
+            geom = QgsGeometry()
+            if wkb is not None:
+                geom.fromWkb(wkb)
+            geometries.append(geom)
+        if self._area_pos >= 0 or self._width_pos >= 0:
+            areas = [g.area() for g in geometries]
+            if self._area_pos >= 0:
+                area_col = self._target_order[self._area_pos]
+                out_df[area_col] = [
+                    a / 10000 if a is not None else prev
+                    for a, prev in zip(areas, out_df[area_col])
+                ]
+            if self._width_pos >= 0:
+                width_col = self._target_order[self._width_pos]
+                out_df[width_col] = [
+                    a ** 0.5 if a not in (None, 0) else prev
+                    for a, prev in zip(areas, out_df[width_col])
+                ]
+        return out_df, geometries
 
+    def _write_bulk_frame(self, frame, geometries, input_layer, parameters, context, feedback):
+        """Create the sink and push the assembled rows in FastInsert chunks."""
         sink, dest_id = self.parameterAsSink(
             parameters,
             self.OUTPUT,
             context,
-            target_fields,
+            self._target_fields,
             input_layer.wkbType(),
             input_layer.sourceCrs()
         )
         if sink is None:
             raise QgsProcessingException(_tr("Could not create output sink."))
-
-        defaults = self._defaults_for_section(self.section_key)
-
-        total = input_layer.featureCount()
-        for idx, feature in enumerate(input_layer.getFeatures()):
-            area_ha = None
-            width_val = None
-            if self.section_key == 'SUBCATCHMENTS':
-                geom = feature.geometry()
-                area_val = geom.area()
-                area_ha = area_val / 10000 if area_val is not None else None
-                width_val = (area_val ** 0.5) if area_val not in [None, 0] else None
-
-            attrs = [
-                self._value_from_feature(feature, field_map.get(field), defaults.get(field))
-                for field in target_fields_def.keys()
-            ]
-            if self.section_key == 'SUBCATCHMENTS':
-                for i, field_name in enumerate(target_fields_def.keys()):
-                    if field_name == 'Area' and (not field_map.get('Area')) and area_ha is not None:
-                        attrs[i] = area_ha
-                    if field_name == 'Width' and (not field_map.get('Width')) and width_val is not None:
-                        attrs[i] = width_val
-
-            out_feat = QgsFeature(target_fields)
-            out_feat.setGeometry(feature.geometry())
-            out_feat.setAttributes(attrs)
-            sink.addFeature(out_feat)
-
-            if feedback.isCanceled():
-                break
-            if total:
-                feedback.setProgress(int((idx + 1) / total * 100))
-
+        rows = frame.to_numpy(dtype=object)
+        total = len(rows)
+        chunk_size = 1000
+        buffer = []
+        for i in range(total):
+            out_feat = QgsFeature(self._target_fields)
+            out_feat.setGeometry(geometries[i])
+            out_feat.setAttributes(list(rows[i]))
+            buffer.append(out_feat)
+            if len(buffer) >= chunk_size:
+                sink.addFeatures(buffer, QgsFeatureSink.FastInsert)
+                buffer = []
+                if feedback.isCanceled():
+                    break
+                if total:
+                    feedback.setProgress(int((i + 1) / total * 100))
+        if buffer:
+            sink.addFeatures(buffer, QgsFeatureSink.FastInsert)
         return {self.OUTPUT: dest_id}
 
-    def _defaults_for_section(self, section: str) -> Dict[str, object]:
-        """Fallback values when a field is missing or empty in the source."""
-        if section == 'SUBCATCHMENTS':
-            return {
-                'Name': '',
-                'RainGage': '*',
-                'Outlet': '',
-                'Area': 0,
-                'Imperv': 0,
-                'Width': 0,
-                'Slope': 0.5,
-                'CurbLen': 0,
-                'SnowPack': '',
-                'N_Imperv': 0.01,
-                'N_Perv': 0.1,
-                'S_Imperv': 1.8,
-                'S_Perv': 3,
-                'PctZero': 0,
-                'RouteTo': 'OUTLET',
-                'PctRouted': 100,
-                'InfMethod': '',
-                'SuctHead': None,
-                'Conductiv': None,
-                'InitDef': None,
-                'MaxRate': None,
-                'MinRate': None,
-                'Decay': None,
-                'DryTime': None,
-                'MaxInf': None,
-                'CurveNum': None
-            }
-        if section == 'JUNCTIONS':
-            return {
-                'Name': '',
-                'Elevation': 0,
-                'MaxDepth': 0,
-                'InitDepth': 0,
-                'SurDepth': 0,
-                'Aponded': 0
-            }
-        if section == 'OUTFALLS':
-            return {
-                'Name': '',
-                'Elevation': 0,
-                'Type': 'FREE',
-                'FixedStage': None,
-                'Curve_TS': '',
-                'FlapGate': '',
-                'RouteTo': ''
-            }
-        if section == 'RAINGAGES':
-            return {
-                'Name': '',
-                'Format': '',
-                'Interval': '',
-                'SCF': 1.0,
-                'DataSource': '',
-                'SeriesName': '',
-                'FileName': '',
-                'StationID': '',
-                'RainUnits': ''
-            }
-        if section == 'STORAGE':
-            return {k: 0 if v == 'Double' else '' for k, v in def_qgis_fields_dict['STORAGE'].items()}
-        if section == 'CONDUITS':
-            return {
-                'Name': '',
-                'FromNode': '',
-                'ToNode': '',
-                'Length': 0,
-                'Roughness': 0.01,
-                'InOffset': 0,
-                'OutOffset': 0,
-                'InitFlow': 0,
-                'MaxFlow': 0,
-                'XsectShape': '',
-                'Geom1': 0,
-                'Geom2': 0,
-                'Geom3': 0,
-                'Geom4': 0,
-                'Barrels': 1,
-                'Culvert': '',
-                'Shp_Trnsct': '',
-                'Kentry': 0,
-                'Kexit': 0,
-                'Kavg': 0,
-                'FlapGate': '',
-                'Seepage': 0
-            }
-        if section == 'ORIFICES':
-            return {
-                'Name': '',
-                'FromNode': '',
-                'ToNode': '',
-                'Type': '',
-                'InOffset': 0,
-                'Qcoeff': 0,
-                'FlapGate': '',
-                'CloseTime': 0,
-                'XsectShape': '',
-                'Height': 0,
-                'Width': 0
-            }
-        if section == 'PUMPS':
-            return {
-                'Name': '',
-                'FromNode': '',
-                'ToNode': '',
-                'PumpCurve': '',
-                'Status': '',
-                'Startup': 0,
-                'Shutoff': 0
-            }
-        if section == 'WEIRS':
-            return {
-                'Name': '',
-                'FromNode': '',
-                'ToNode': '',
-                'Type': '',
-                'CrestHeigh': 0,
-                'Qcoeff': 0,
-                'FlapGate': '',
-                'EndContrac': 0,
-                'EndCoeff': 0,
-                'Surcharge': '',
-                'RoadWidth': 0,
-                'RoadSurf': '',
-                'CoeffCurve': '',
-                'Height': 0,
-                'Length': 0,
-                'SideSlope': 0
-            }
-        return {k: None for k in def_qgis_fields_dict[section].keys()}
-
-    def _field_definitions(self, section: str) -> List[Tuple[str, str, str, bool]]:
-        """Define which SWMM fields can be mapped per section (param id, label, target, required)."""
-        if section == 'SUBCATCHMENTS':
-            return [
-                ('NAME_FIELD', 'Name field', 'Name', True),
-                ('RAINGAGE_FIELD', 'RainGage field', 'RainGage', False),
-                ('OUTLET_FIELD', 'Outlet field', 'Outlet', True),
-                ('AREA_FIELD', 'Area field', 'Area', False),
-                ('IMPERV_FIELD', '%Imperv field', 'Imperv', True),
-                ('WIDTH_FIELD', 'Width field', 'Width', False),
-                ('SLOPE_FIELD', 'Slope field', 'Slope', False),
-                ('CURBLEN_FIELD', 'CurbLen field', 'CurbLen', False),
-                ('SNOWPACK_FIELD', 'SnowPack field', 'SnowPack', False),
-                ('NIMPERV_FIELD', 'N-Imperv field', 'N_Imperv', False),
-                ('NPERV_FIELD', 'N-Perv field', 'N_Perv', False),
-                ('SIMPERV_FIELD', 'S-Imperv field', 'S_Imperv', False),
-                ('SPERV_FIELD', 'S-Perv field', 'S_Perv', False),
-                ('PCTZERO_FIELD', 'PctZero field', 'PctZero', False),
-                ('ROUTETO_FIELD', 'RouteTo field', 'RouteTo', False),
-                ('PCTR_FIELD', 'PctRouted field', 'PctRouted', False),
-                ('INFMETHOD_FIELD', 'InfMethod field', 'InfMethod', False),
-                ('SUCTHEAD_FIELD', 'SuctHead field', 'SuctHead', False),
-                ('CONDUCTIV_FIELD', 'Conductiv field', 'Conductiv', False),
-                ('INITDEF_FIELD', 'InitDef field', 'InitDef', False),
-                ('MAXRATE_FIELD', 'MaxRate field', 'MaxRate', False),
-                ('MINRATE_FIELD', 'MinRate field', 'MinRate', False),
-                ('DECAY_FIELD', 'Decay field', 'Decay', False),
-                ('DRYTIME_FIELD', 'DryTime field', 'DryTime', False),
-                ('MAXINF_FIELD', 'MaxInf field', 'MaxInf', False),
-                ('CURVENUM_FIELD', 'CurveNum field', 'CurveNum', False),
-            ]
-        if section == 'JUNCTIONS':
-            return [
-                ('NAME_FIELD', 'Name field', 'Name', True),
-                ('ELEV_FIELD', 'Elevation field', 'Elevation', True),
-                ('MAXDEPTH_FIELD', 'MaxDepth field', 'MaxDepth', True),
-                ('INITDEPTH_FIELD', 'InitDepth field', 'InitDepth', False),
-                ('SURDEPTH_FIELD', 'SurDepth field', 'SurDepth', False),
-                ('APONDED_FIELD', 'Aponded field', 'Aponded', False),
-            ]
-        if section == 'OUTFALLS':
-            return [
-                ('NAME_FIELD', 'Name field', 'Name', True),
-                ('ELEV_FIELD', 'Elevation field', 'Elevation', True),
-                ('TYPE_FIELD', 'Type field', 'Type', True),
-                ('FIXED_FIELD', 'FixedStage field', 'FixedStage', False),
-                ('CURVE_FIELD', 'Curve_TS field', 'Curve_TS', False),
-                ('FLAP_FIELD', 'FlapGate field', 'FlapGate', False),
-                ('ROUTETO_FIELD', 'RouteTo field', 'RouteTo', False),
-            ]
-        if section == 'RAINGAGES':
-            return [
-                ('NAME_FIELD', 'Name field', 'Name', True),
-                ('FORMAT_FIELD', 'Format field', 'Format', True),
-                ('INTERVAL_FIELD', 'Interval field', 'Interval', True),
-                ('SCF_FIELD', 'SCF field', 'SCF', False),
-                ('DATASRC_FIELD', 'DataSource field', 'DataSource', False),
-                ('SERIES_FIELD', 'SeriesName field', 'SeriesName', False),
-                ('FILE_FIELD', 'FileName field', 'FileName', False),
-                ('STATION_FIELD', 'StationID field', 'StationID', False),
-                ('RAINUNITS_FIELD', 'RainUnits field', 'RainUnits', False),
-            ]
-        if section == 'STORAGE':
-            return [
-                ('NAME_FIELD', 'Name field', 'Name', True),
-                ('ELEV_FIELD', 'Elevation field', 'Elevation', True),
-                ('MAXDEPTH_FIELD', 'MaxDepth field', 'MaxDepth', True),
-                ('INITDEPTH_FIELD', 'InitDepth field', 'InitDepth', False),
-                ('TYPE_FIELD', 'Type field', 'Type', False),
-                ('CURVE_FIELD', 'Curve field', 'Curve', False),
-                ('COEFF_FIELD', 'Coeff field', 'Coeff', False),
-                ('EXP_FIELD', 'Exponent field', 'Exponent', False),
-                ('CONST_FIELD', 'Constant field', 'Constant', False),
-                ('MAJORAX_FIELD', 'MajorAxis field', 'MajorAxis', False),
-                ('MINORAX_FIELD', 'MinorAxis field', 'MinorAxis', False),
-                ('SIDESLOPE_FIELD', 'SideSlope field', 'SideSlope', False),
-                ('SURFHEIGHT_FIELD', 'SurfHeight field', 'SurfHeight', False),
-                ('SURDEPTH_FIELD', 'SurDepth field', 'SurDepth', False),
-                ('FEVAP_FIELD', 'Fevap field', 'Fevap', False),
-                ('PSI_FIELD', 'Psi field', 'Psi', False),
-                ('KSAT_FIELD', 'Ksat field', 'Ksat', False),
-                ('IMD_FIELD', 'IMD field', 'IMD', False),
-            ]
-        if section == 'CONDUITS':
-            return [
-                ('NAME_FIELD', 'Name field', 'Name', True),
-                ('FROM_FIELD', 'FromNode field', 'FromNode', True),
-                ('TO_FIELD', 'ToNode field', 'ToNode', True),
-                ('LENGTH_FIELD', 'Length field', 'Length', True),
-                ('ROUGH_FIELD', 'Roughness field', 'Roughness', False),
-                ('INOFF_FIELD', 'InOffset field', 'InOffset', False),
-                ('OUTOFF_FIELD', 'OutOffset field', 'OutOffset', False),
-                ('INITFLOW_FIELD', 'InitFlow field', 'InitFlow', False),
-                ('MAXFLOW_FIELD', 'MaxFlow field', 'MaxFlow', False),
-                ('XSECTSHAPE_FIELD', 'XsectShape field', 'XsectShape', False),
-                ('GEOM1_FIELD', 'Geom1 field', 'Geom1', False),
-                ('GEOM2_FIELD', 'Geom2 field', 'Geom2', False),
-                ('GEOM3_FIELD', 'Geom3 field', 'Geom3', False),
-                ('GEOM4_FIELD', 'Geom4 field', 'Geom4', False),
-                ('BARRELS_FIELD', 'Barrels field', 'Barrels', False),
-                ('CULVERT_FIELD', 'Culvert field', 'Culvert', False),
-                ('SHPTRNS_FIELD', 'Shp_Trnsct field', 'Shp_Trnsct', False),
-                ('KENTRY_FIELD', 'Kentry field', 'Kentry', False),
-                ('KEXIT_FIELD', 'Kexit field', 'Kexit', False),
-                ('KAVG_FIELD', 'Kavg field', 'Kavg', False),
-                ('FLAP_FIELD', 'FlapGate field', 'FlapGate', False),
-                ('SEEP_FIELD', 'Seepage field', 'Seepage', False),
-            ]
-        if section == 'ORIFICES':
-            return [
-                ('NAME_FIELD', 'Name field', 'Name', True),
-                ('FROM_FIELD', 'FromNode field', 'FromNode', True),
-                ('TO_FIELD', 'ToNode field', 'ToNode', True),
-                ('TYPE_FIELD', 'Type field', 'Type', True),
-                ('INOFF_FIELD', 'InOffset field', 'InOffset', False),
-                ('QCOEFF_FIELD', 'Qcoeff field', 'Qcoeff', False),
-                ('FLAP_FIELD', 'FlapGate field', 'FlapGate', False),
-                ('CLOSETIME_FIELD', 'CloseTime field', 'CloseTime', False),
-                ('XSECTSHAPE_FIELD', 'XsectShape field', 'XsectShape', False),
-                ('HEIGHT_FIELD', 'Height field', 'Height', False),
-                ('WIDTH_FIELD', 'Width field', 'Width', False),
-            ]
-        if section == 'PUMPS':
-            return [
-                ('NAME_FIELD', 'Name field', 'Name', True),
-                ('FROM_FIELD', 'FromNode field', 'FromNode', True),
-                ('TO_FIELD', 'ToNode field', 'ToNode', True),
-                ('CURVE_FIELD', 'PumpCurve field', 'PumpCurve', True),
-                ('STATUS_FIELD', 'Status field', 'Status', False),
-                ('STARTUP_FIELD', 'Startup field', 'Startup', False),
-                ('SHUTOFF_FIELD', 'Shutoff field', 'Shutoff', False),
-            ]
-        if section == 'WEIRS':
-            return [
-                ('NAME_FIELD', 'Name field', 'Name', True),
-                ('FROM_FIELD', 'FromNode field', 'FromNode', True),
-                ('TO_FIELD', 'ToNode field', 'ToNode', True),
-                ('TYPE_FIELD', 'Type field', 'Type', True),
-                ('CREST_FIELD', 'CrestHeigh field', 'CrestHeigh', False),
-                ('QCOEFF_FIELD', 'Qcoeff field', 'Qcoeff', False),
-                ('FLAP_FIELD', 'FlapGate field', 'FlapGate', False),
-                ('ENDCONTR_FIELD', 'EndContrac field', 'EndContrac', False),
-                ('ENDCOEFF_FIELD', 'EndCoeff field', 'EndCoeff', False),
-                ('SURCH_FIELD', 'Surcharge field', 'Surcharge', False),
-                ('ROADWIDTH_FIELD', 'RoadWidth field', 'RoadWidth', False),
-                ('ROADSURF_FIELD', 'RoadSurf field', 'RoadSurf', False),
-                ('COEFFCURVE_FIELD', 'CoeffCurve field', 'CoeffCurve', False),
-                ('HEIGHT_FIELD', 'Height field', 'Height', False),
-                ('LENGTH_FIELD', 'Length field', 'Length', False),
-                ('SIDESLOPE_FIELD', 'SideSlope field', 'SideSlope', False),
-            ]
-        return []
-
-    def _value_from_feature(self, feature, field_name, default_val):
-        """Get a value from a feature field, falling back to default when missing/empty."""
-        if field_name and field_name in feature.fields().names():
-            val = feature[field_name]
-            if val not in [None, '']:
-                return val
-        return default_val
+    def processFeature(self, feature, context, feedback):
+        """Map one input feature onto the SWMM schema; iteration and sink are handled by QGIS."""
+        attrs = self._assemble(feature)
+        if self._area_pos >= 0 or self._width_pos >= 0:
+            area_val = feature.geometry().area()
+            if self._area_pos >= 0 and area_val is not None:
+                attrs[self._area_pos] = area_val / 10000
+            if self._width_pos >= 0 and area_val not in (None, 0):
+                attrs[self._width_pos] = area_val ** 0.5
+
+        feature.setAttributes(attrs)
+        return [feature]